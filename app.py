@@ -0,0 +1,47 @@
+import io
+
+import streamlit as st
+
+from jd_matcher import match_keywords
+from keyword_extractor import extract_keywords
+from resume_parser import extract_text
+from score_calculator import calculate_similarity
+
+@st.cache_data
+def _jd_keywords(jd_text):
+    # Cached separately from _analyze (and via st.cache_data, which survives
+    # Streamlit reruns): one JD scored against several resumes only pays
+    # keyword extraction once.
+    return extract_keywords(jd_text)
+
+@st.cache_data
+def _analyze(resume_bytes, resume_name, jd_text):
+    # Keyed on the raw upload bytes + JD text, so re-clicking Analyze with
+    # the same inputs skips the whole parse/NLP/similarity pipeline.
+    resume_file = io.BytesIO(resume_bytes)
+    resume_file.name = resume_name
+    resume_text = extract_text(resume_file)
+    resume_keywords = extract_keywords(resume_text)
+    jd_keywords = _jd_keywords(jd_text)
+    matched, missing = match_keywords(jd_keywords, resume_keywords)
+    return {
+        "score": calculate_similarity(resume_text, jd_text),
+        "matched": matched,
+        "missing": missing,
+    }
+
+def main():
+    st.title("AI-based Resume Analyzer")
+    resume_file = st.file_uploader("Upload your resume", type=["pdf", "docx", "txt"])
+    jd_text = st.text_area("Paste the job description")
+
+    if st.button("Analyze") and resume_file and jd_text.strip():
+        result = _analyze(resume_file.getvalue(), resume_file.name, jd_text)
+        st.metric("ATS Score", f"{result['score']}%")
+        st.subheader("Matched keywords")
+        st.write(", ".join(result["matched"]) or "None")
+        st.subheader("Missing keywords")
+        st.write(", ".join(result["missing"]) or "None")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,24 @@
+import numpy as np
+
+# Below this size the set-based path wins; np.isin only pays off once the
+# keyword lists grow into the hundreds (e.g. a full skill vocabulary).
+_VECTORIZE_THRESHOLD = 256
+
+def match_keywords(jd_keywords, resume_keywords):
+    if len(jd_keywords) >= _VECTORIZE_THRESHOLD and resume_keywords:
+        # Compare stable per-process string hashes with NumPy's C loop
+        # instead of per-element Python membership checks.
+        jd = np.fromiter((hash(w) for w in jd_keywords), dtype=np.int64, count=len(jd_keywords))
+        rk = np.fromiter((hash(w) for w in resume_keywords), dtype=np.int64, count=len(resume_keywords))
+        mask = np.isin(jd, rk)
+        matched = [w for w, m in zip(jd_keywords, mask) if m]
+        missing = [w for w, m in zip(jd_keywords, mask) if not m]
+        return matched, missing
+    # One hash-set build plus a single pass over the JD keywords; keeps the
+    # JD ordering while avoiding O(N*M) list membership checks.
+    rset = set(resume_keywords)
+    matched = []
+    missing = []
+    for w in jd_keywords:
+        (matched if w in rset else missing).append(w)
+    return matched, missing
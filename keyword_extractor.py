@@ -1,11 +1,55 @@
+import functools
 import re
-import spacy
 from collections import Counter
 
-nlp = spacy.load("en_core_web_sm")
+import streamlit as st
 
-def extract_keywords(text):
-    doc = nlp(text.lower())
-    words = [token.lemma_ for token in doc if token.is_alpha and not token.is_stop]
-    keywords = [w for w, _ in Counter(words).most_common(20)]
-    return keywords
+# Fast path: the extractor only needs lowercase alphabetic tokens minus
+# stopwords, so a compiled regex plus a frozenset lookup covers the common
+# case without paying for a full spaCy pipeline.
+_TOKEN = re.compile(r"[a-z]{2,}")
+
+@functools.lru_cache(maxsize=1)
+def _get_stopwords():
+    # Deferred: importing spacy at module level adds seconds to every
+    # Streamlit cold start even when no analysis is run.
+    from spacy.lang.en.stop_words import STOP_WORDS
+    return frozenset(STOP_WORDS)
+
+@st.cache_resource
+def _get_nlp():
+    import spacy
+    # Only lemmas, is_alpha and is_stop are consumed downstream, so skip the
+    # parser/NER components. tok2vec and attribute_ruler must stay: the
+    # tagger listens to tok2vec, and the rule lemmatizer needs the POS tags
+    # the attribute ruler sets — without them lemmas degrade to lowercased
+    # text. cache_resource shares one model instance across Streamlit
+    # sessions and reruns instead of reloading it on every call.
+    return spacy.load("en_core_web_sm", disable=["parser", "ner"])
+
+def _top_keywords(doc, top_k):
+    from spacy.attrs import IS_ALPHA, IS_STOP, LEMMA
+    # One to_array call pulls all needed attributes into a contiguous array,
+    # replacing N per-token Python attribute accesses with a NumPy mask.
+    arr = doc.to_array([IS_ALPHA, IS_STOP, LEMMA])
+    keep = arr[(arr[:, 0] == 1) & (arr[:, 1] == 0), 2]
+    strings = doc.vocab.strings
+    words = [strings[h] for h in keep]
+    return [w for w, _ in Counter(words).most_common(top_k)]
+
+def extract_keywords(text, top_k=20, use_spacy=False):
+    if use_spacy:
+        nlp = _get_nlp()
+        return _top_keywords(nlp(text.lower()), top_k)
+    stop = _get_stopwords()
+    words = [w for w in _TOKEN.findall(text.lower()) if w not in stop]
+    return [w for w, _ in Counter(words).most_common(top_k)]
+
+def extract_keywords_batch(texts, top_k=20, use_spacy=False):
+    if not use_spacy:
+        return [extract_keywords(t, top_k) for t in texts]
+    # One nlp.pipe call amortizes pipeline dispatch across documents, so
+    # analyzing resume + job description costs roughly one spaCy run.
+    nlp = _get_nlp()
+    docs = nlp.pipe([t.lower() for t in texts], batch_size=len(texts))
+    return [_top_keywords(doc, top_k) for doc in docs]
@@ -0,0 +1,34 @@
+import io
+
+def _extract_pdf_text(file):
+    data = file.read()
+    try:
+        # PDFium (native C++) decodes PDF streams an order of magnitude
+        # faster than pure-Python PyPDF2.
+        import pypdfium2 as pdfium
+        pdf = pdfium.PdfDocument(data)
+        try:
+            return "\n".join(page.get_textpage().get_text_range() for page in pdf)
+        finally:
+            pdf.close()
+    except Exception:
+        import PyPDF2
+        reader = PyPDF2.PdfReader(io.BytesIO(data))
+        # Accumulate pages and join once: += on str copies the whole buffer
+        # per page, and extract_text() can return None for empty pages.
+        parts = []
+        for page in reader.pages:
+            parts.append(page.extract_text() or "")
+        return "".join(parts)
+
+def extract_text(file):
+    # Parser libraries are imported on demand so Streamlit reruns don't pay
+    # for them before a file is uploaded.
+    name = getattr(file, "name", "").lower()
+    if name.endswith(".pdf"):
+        return _extract_pdf_text(file)
+    if name.endswith(".docx"):
+        import docx2txt
+        return docx2txt.process(file)
+    data = file.read()
+    return data.decode("utf-8", errors="ignore") if isinstance(data, bytes) else data
@@ -0,0 +1,50 @@
+import functools
+
+@functools.lru_cache(maxsize=1)
+def _get_vec():
+    # Deferred import + lazy singleton: sklearn is only loaded when a score
+    # is actually computed, not on every Streamlit rerun. Hashing needs no
+    # vocabulary or IDF fit, and with so few documents the IDF term is
+    # degenerate anyway. Rows come out L2-normalized, so a sparse dot
+    # product is already the cosine similarity.
+    from sklearn.feature_extraction.text import HashingVectorizer
+    return HashingVectorizer(n_features=2 ** 18, alternate_sign=False, norm="l2", stop_words="english")
+
+@functools.lru_cache(maxsize=1)
+def _get_cos():
+    import numpy as np
+    from numba import njit
+
+    @njit(cache=True, fastmath=True)
+    def _cos(a, b):
+        # Single fused pass over both vectors: no NumPy temporaries, and
+        # Numba lowers the loop to SIMD machine code.
+        d = 0.0
+        na = 0.0
+        nb = 0.0
+        for i in range(a.shape[0]):
+            d += a[i] * b[i]
+            na += a[i] * a[i]
+            nb += b[i] * b[i]
+        return d / (na ** 0.5 * nb ** 0.5 + 1e-12)
+
+    # Warm up the JIT on first use so the first real call pays compilation
+    # here rather than mid-analysis.
+    _cos(np.zeros(4), np.ones(4))
+    return _cos
+
+def cosine_dense(a, b):
+    import numpy as np
+    cos = _get_cos()
+    return float(cos(np.ascontiguousarray(a, dtype=np.float64),
+                     np.ascontiguousarray(b, dtype=np.float64)))
+
+@functools.lru_cache(maxsize=64)
+def _jd_row(jd_text):
+    # One JD is typically scored against many resumes; hashing is stateless,
+    # so its transformed row can be cached and reused across calls.
+    return _get_vec().transform([jd_text])
+
+def calculate_similarity(resume_text, jd_text):
+    X = _get_vec().transform([resume_text])
+    return round(float(X.multiply(_jd_row(jd_text)).sum()) * 100, 2)